@@ -1,16 +1,65 @@
+import io
+import logging
 import os
+import queue
+import re
 import subprocess
 import argparse
+import functools
 import tempfile
+import threading
 import shutil
 import zipfile
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from tqdm import tqdm
 
+log = logging.getLogger(__name__)
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None  # Installed before converting, see ensure_pillow
+
+# Optional faster PNG encoder, Pillow is used when it is not installed
+try:
+    import imagecodecs
+    import numpy
+except ImportError:
+    imagecodecs = None
+
 # Define full paths to executables
 DDJVU_PATH = r"C:\Program Files (x86)\DjVuLibre\ddjvu.exe"
 DJVUSED_PATH = r"C:\Program Files (x86)\DjVuLibre\djvused.exe"  # Add path to djvused.exe
 
+# Approximate number of pages extracted by a single ddjvu run
+PAGES_PER_CHUNK = 16
+
+# Write buffer for CBZ files, so pages reach the disk in a few large writes
+ZIP_BUFFER_SIZE = 8 * 1024 * 1024
+
+# zlib level for PNG pages: much faster than the default of 6 and barely larger for scans
+PNG_COMPRESS_LEVEL = 1
+
+# Show the error output of failed ddjvu runs, enabled with --verbose
+VERBOSE = False
+
+# Log messages read like the plain progress output of the script
+LOG_FORMAT = "%(message)s"
+
+# Page lines in the output of ddjvu -l
+_PAGE_RE = re.compile(r"^[ \t]*Page ", re.M)
+
+# PNM header written by ddjvu: magic number, width and height
+_PNM_HEADER_RE = re.compile(rb"P([456])\s+(\d+)\s+(\d+)\s")
+_PNM_MAXVAL_RE = re.compile(rb"\s*\d+\s")
+# PIL image mode and raw decoder mode for each PNM magic number
+_PNM_MODES = {
+    b"4": ("1", "1;I"),  # PBM, 1 bit per pixel with 1 meaning black
+    b"5": ("L", "L"),  # PGM
+    b"6": ("RGB", "RGB"),  # PPM
+}
+
+@functools.lru_cache(maxsize=None)
 def get_page_count(input_file):
     """Get the number of pages in a DJVU file."""
     try:
@@ -20,7 +69,7 @@ def get_page_count(input_file):
         if process.returncode == 0 and process.stdout.strip().isdigit():
             return int(process.stdout.strip())
     except Exception as e:
-        print(f"Error getting page count with djvused: {str(e)}")
+        log.warning(f"Error getting page count with djvused: {str(e)}")
     
     try:
         # Alternative method: use ddjvu to dump info and count pages
@@ -28,62 +77,217 @@ def get_page_count(input_file):
         process = subprocess.run(cmd, capture_output=True, text=True)
         if process.returncode == 0:
             # Count lines that start with "Page"
-            pages = [line for line in process.stdout.split('\n') if line.strip().startswith('Page ')]
+            pages = len(_PAGE_RE.findall(process.stdout))
             if pages:
-                return len(pages)
+                return pages
     except Exception as e:
-        print(f"Error getting page count with ddjvu -l: {str(e)}")
+        log.warning(f"Error getting page count with ddjvu -l: {str(e)}")
     
     # If all else fails, return a default value
-    print("Could not determine page count, using default value")
+    log.warning("Could not determine page count, using default value")
     return 100  # Reasonable default
 
-def extract_page(ddjvu_path, input_file, output_file, page, quality=85):
-    """Extract a single page from a DJVU file."""
+def ensure_pillow():
+    """Install Pillow if it could not be imported when the module was loaded."""
+    global Image
+    if Image is None:
+        print("Installing required Python package: Pillow")
+        subprocess.run(["pip", "install", "Pillow"], check=True)
+        from PIL import Image
+
+def set_verbose(verbose):
+    """Enable or disable verbose ddjvu error output."""
+    global VERBOSE
+    VERBOSE = verbose
+
+def init_worker(verbose, log_level):
+    """Set up a worker process with the logging and verbose settings of the main process."""
+    logging.basicConfig(level=log_level, format=LOG_FORMAT)
+    set_verbose(verbose)
+
+def run_ddjvu(cmd, stdout=subprocess.DEVNULL):
+    """Run ddjvu, discarding its error output unless verbose output is enabled."""
+    process = subprocess.run(cmd, stdout=stdout, stderr=subprocess.PIPE if VERBOSE else subprocess.DEVNULL)
+    if process.returncode != 0 and VERBOSE:
+        log.warning(f"ddjvu failed with exit code {process.returncode}: "
+                    f"{process.stderr.decode(errors='replace').strip()}")
+    return process
+
+def parse_pnm_header(data):
+    """Return the magic number, width, height and pixel data offset of raw PNM data (as written by ddjvu)."""
+    match = _PNM_HEADER_RE.match(data)
+    if not match:
+        raise ValueError("Unrecognized PNM header")
+    magic, width, height = match.group(1), int(match.group(2)), int(match.group(3))
+    offset = match.end()
+    if magic != b"4":
+        # PGM and PPM headers have a maxval field followed by a single whitespace
+        maxval = _PNM_MAXVAL_RE.match(data, offset)
+        if not maxval:
+            raise ValueError("Unrecognized PNM header")
+        offset = maxval.end()
+    return magic, width, height, offset
+
+def pnm_to_png(data):
+    """Encode raw PNM data (as written by ddjvu) as PNG data in memory."""
+    magic, width, height, offset = parse_pnm_header(data)
+    if imagecodecs is not None and magic != b"4":
+        # View the greyscale or RGB pixel data as an array, without copying it
+        shape = (height, width, 3) if magic == b"6" else (height, width)
+        pixels = numpy.frombuffer(data, dtype=numpy.uint8, count=numpy.prod(shape), offset=offset)
+        return imagecodecs.png_encode(pixels.reshape(shape), level=PNG_COMPRESS_LEVEL)
+    
+    # Pillow only shares the buffer for greyscale pages, RGB and bilevel pixel data is copied
+    mode, raw_mode = _PNM_MODES[magic]
+    image = Image.frombuffer(mode, (width, height), memoryview(data)[offset:], "raw", raw_mode, 0, 1)
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG", compress_level=PNG_COMPRESS_LEVEL)
+    return buffer.getvalue()
+
+def extract_page(ddjvu_path, input_file, page, quality=85):
+    """Extract a single page from a DJVU file as PNG data, or return None on failure."""
     try:
-        # Try direct extraction to PNG
-        cmd = [
-            ddjvu_path,
-            "-page=" + str(page),
-            "-format=png",
-            "-mode=color",
-            "-quality=" + str(quality),
-            "-skip",  # Skip errors
-            input_file,
-            output_file
-        ]
-        
-        process = subprocess.run(cmd, capture_output=True, text=True)
-        if process.returncode == 0 and os.path.exists(output_file):
-            return True
+        # Try color first, then black and white for pages that fail to render in color
+        for mode in ("color", "black"):
+            cmd = [
+                ddjvu_path,
+                "-page=" + str(page),
+                "-format=pnm",
+                "-mode=" + mode,
+                "-quality=" + str(quality),
+                "-skip",  # Skip errors
+                input_file,
+                "-"  # Write to stdout
+            ]
+            
+            process = run_ddjvu(cmd, stdout=subprocess.PIPE)
+            if process.returncode == 0 and process.stdout:
+                return pnm_to_png(process.stdout)
         
-        # If direct extraction failed, try alternative method
+        return None
+    except Exception as e:
+        log.warning(f"Error extracting page {page}: {str(e)}")
+        return None
+
+def extract_page_range(ddjvu_path, input_file, output_dir, start, end, quality=85):
+    """Extract a range of pages from a DJVU file as PNM files in a single ddjvu run."""
+    try:
         cmd = [
             ddjvu_path,
-            "-page=" + str(page),
-            "-format=tiff",  # Try TIFF format
+            f"-page={start}-{end}",
+            "-format=pnm",  # Keeps bilevel and greyscale pages at their own depth
+            "-eachpage",
             "-mode=color",
             "-quality=" + str(quality),
-            "-skip",
+            "-skip",  # Skip errors
             input_file,
-            output_file.replace(".png", ".tiff")
+            os.path.join(output_dir, "page_%04d.pnm")
         ]
         
-        process = subprocess.run(cmd, capture_output=True, text=True)
-        if process.returncode == 0 and os.path.exists(output_file.replace(".png", ".tiff")):
-            # Convert TIFF to PNG
-            tiff_file = output_file.replace(".png", ".tiff")
-            from PIL import Image
-            Image.open(tiff_file).save(output_file)
-            os.remove(tiff_file)  # Clean up TIFF file
-            return True
-        
-        return False
+        process = run_ddjvu(cmd)
+        return process.returncode == 0
     except Exception as e:
-        print(f"Error extracting page {page}: {str(e)}")
+        log.warning(f"Error extracting pages {start}-{end}: {str(e)}")
         return False
 
-def convert_djvu_to_cbz(input_file, output_file, quality=85):
+def encode_page(input_file, temp_dir, page, quality=85):
+    """Encode an extracted page as PNG data, or return None if it cannot be extracted."""
+    pnm_path = os.path.join(temp_dir, f"page_{page:04d}.pnm")
+    if os.path.exists(pnm_path):
+        # Encode the page to PNG in memory, straight from the PNM file contents
+        with open(pnm_path, 'rb') as f:
+            pnm_data = f.read()
+        os.remove(pnm_path)  # Clean up PNM file
+        return pnm_to_png(pnm_data)
+    
+    # Page was missing after the range extraction, retry it on its own
+    return extract_page(DDJVU_PATH, input_file, page, quality)
+
+class PageScheduler:
+    """
+    Hand out work on a document to the page workers: ddjvu runs for page ranges,
+    and pages to encode in page order once their range is on disk.
+    
+    Pages are only handed out within a window of pages from the next page to
+    write to the CBZ file, so the encoded pages waiting to be written stay
+    proportional to the number of workers, not to the length of the document.
+    """
+    
+    def __init__(self, page_ranges, window_size):
+        self.page_ranges = page_ranges
+        self.range_extracted = [False] * len(page_ranges)
+        self.num_pages = page_ranges[-1][1]
+        self.chunk_size = page_ranges[0][1] - page_ranges[0][0] + 1
+        self.window_size = window_size
+        self.next_range = 0  # Next page range to extract
+        self.next_encode = 1  # Next page to encode
+        self.next_write = 1  # Next page to write to the CBZ file
+        self.cancelled = False
+        self.condition = threading.Condition()
+    
+    def next_task(self):
+        """
+        Wait for the next task: ("encode", page) or ("extract", range_index).
+        Returns None when there is no work left or the conversion was cancelled.
+        """
+        with self.condition:
+            while not self.cancelled:
+                page = self.next_encode
+                if page > self.num_pages and self.next_range == len(self.page_ranges):
+                    return None
+                # Encoding comes first, it frees memory once the pages are written
+                if (page <= self.num_pages and page < self.next_write + self.window_size
+                        and self.range_extracted[(page - 1) // self.chunk_size]):
+                    self.next_encode += 1
+                    return ("encode", page)
+                # Otherwise extract the next page range ahead, PNM files on disk cost no memory
+                if self.next_range < len(self.page_ranges):
+                    self.next_range += 1
+                    return ("extract", self.next_range - 1)
+                self.condition.wait()
+            return None
+    
+    def mark_extracted(self, range_index):
+        """Record that a page range is on disk, so its pages can be encoded."""
+        with self.condition:
+            self.range_extracted[range_index] = True
+            self.condition.notify_all()
+    
+    def mark_written(self, next_write):
+        """Move the window once the pages before next_write have been written."""
+        with self.condition:
+            self.next_write = next_write
+            self.condition.notify_all()
+    
+    def cancel(self):
+        """Stop all page workers, including those waiting for work."""
+        with self.condition:
+            self.cancelled = True
+            self.condition.notify_all()
+
+def process_pages(input_file, temp_dir, quality, scheduler, page_queue):
+    """Run tasks from the scheduler, putting (page, PNG data) pairs on a queue for encoded pages."""
+    while True:
+        task = scheduler.next_task()
+        if task is None:
+            return
+        kind, value = task
+        if kind == "extract":
+            start, end = scheduler.page_ranges[value]
+            try:
+                extract_page_range(DDJVU_PATH, input_file, temp_dir, start, end, quality)
+            finally:
+                # Pages missing after the run are extracted one by one in encode_page
+                scheduler.mark_extracted(value)
+        else:
+            png_data = None
+            try:
+                png_data = encode_page(input_file, temp_dir, value, quality)
+            except Exception as e:
+                log.warning(f"Error encoding page {value}: {str(e)}")
+            page_queue.put((value, png_data))
+
+def convert_djvu_to_cbz(input_file, output_file, quality=85, inner_workers=1):
     """
     Convert a DJVU file to CBZ format.
     
@@ -91,58 +295,116 @@ def convert_djvu_to_cbz(input_file, output_file, quality=85):
         input_file: Path to the DJVU file
         output_file: Path to save the CBZ file
         quality: Image quality (1-100), higher means better quality but larger file
+        inner_workers: Number of threads extracting page ranges and encoding pages
+            of this file while the finished pages are written to the CBZ file
     """
-    print(f"Converting: {input_file} to {output_file}")
+    log.info(f"Converting: {input_file} to {output_file}")
     
     # Create a temporary directory to store the extracted images
     temp_dir = tempfile.mkdtemp()
-    print(f"Created temporary directory: {temp_dir}")
+    log.debug(f"Created temporary directory: {temp_dir}")
+    
+    # Write to a partial file first, so an interrupted run never leaves a CBZ
+    # file that a later run would skip as already converted
+    partial_file = output_file + ".part"
     
     try:
         # Get the number of pages in the DJVU file
         num_pages = get_page_count(input_file)
-        print(f"Document has {num_pages} pages")
+        log.debug(f"Document has {num_pages} pages")
         
-        # Extract each page as a separate image
+        if num_pages <= 0:
+            log.error(f"Error: Could not extract any pages from {input_file}")
+            return False
+        
+        # Split the document into page ranges, each extracted by its own ddjvu run
+        num_chunks = max(1, num_pages // PAGES_PER_CHUNK)
+        chunk_size = -(-num_pages // num_chunks)  # Round up
+        page_ranges = [(start, min(start + chunk_size - 1, num_pages))
+                       for start in range(1, num_pages + 1, chunk_size)]
+        
+        # Create the CBZ file (which is just a ZIP file with images).
+        # PNG data is already compressed, so store it without deflating it again.
+        log.debug(f"Extracting {num_pages} pages to CBZ file: {output_file}")
+        # Pages are only encoded within a window of inner_workers * 2 pages from
+        # the next page to write, so memory follows the degree of parallelism
+        # rather than the length of the document
+        page_queue = queue.Queue()
+        scheduler = PageScheduler(page_ranges, inner_workers * 2)
         successful_pages = 0
-        for page in range(1, num_pages + 1):
-            # Create output filename with leading zeros for proper sorting
-            page_filename = os.path.join(temp_dir, f"page_{page:04d}.png")
-            
-            print(f"Extracting page {page}/{num_pages}...")
-            if extract_page(DDJVU_PATH, input_file, page_filename, page, quality):
-                successful_pages += 1
-            else:
-                print(f"Warning: Failed to extract page {page}")
+        executor = ThreadPoolExecutor(max_workers=inner_workers)
+        try:
+            with open(partial_file, 'wb', buffering=ZIP_BUFFER_SIZE) as cbz_file, \
+                    zipfile.ZipFile(cbz_file, 'w', compression=zipfile.ZIP_STORED, allowZip64=True) as zipf:
+                # Extract page ranges and encode pages in the background
+                futures = [executor.submit(process_pages, input_file, temp_dir, quality,
+                                           scheduler, page_queue)
+                           for _ in range(inner_workers)]
+                
+                # Write pages to the ZIP file in page order as they become available
+                pending = {}
+                next_page = 1
+                while next_page <= num_pages:
+                    try:
+                        # Wait with a timeout, so Ctrl+C is handled on Windows as well
+                        page, png_data = page_queue.get(timeout=1)
+                    except queue.Empty:
+                        # Fail instead of waiting forever if a producer died or all of
+                        # them stopped without queuing the next page
+                        failed = [future.exception() for future in futures
+                                  if future.done() and not future.cancelled() and future.exception()]
+                        if failed or (all(future.done() for future in futures) and page_queue.empty()):
+                            raise RuntimeError(f"Page workers stopped before page {next_page} was extracted") \
+                                from (failed[0] if failed else None)
+                        continue
+                    pending[page] = png_data
+                    while next_page in pending:
+                        png_data = pending.pop(next_page)
+                        if png_data is None:
+                            log.warning(f"Warning: Failed to extract page {next_page}")
+                        else:
+                            zipf.writestr(f"page_{next_page:04d}.png", png_data)
+                            successful_pages += 1
+                        next_page += 1
+                    scheduler.mark_written(next_page)
+        finally:
+            # Stop the page workers, also after an error or Ctrl+C
+            scheduler.cancel()
+            executor.shutdown(wait=True, cancel_futures=True)
         
         if successful_pages == 0:
-            print(f"Error: Could not extract any pages from {input_file}")
+            log.error(f"Error: Could not extract any pages from {input_file}")
             return False
         
-        # Create the CBZ file (which is just a ZIP file with images)
-        print(f"Creating CBZ file: {output_file}")
-        with zipfile.ZipFile(output_file, 'w') as zipf:
-            # Get all the PNG files in the temp directory
-            png_files = [f for f in os.listdir(temp_dir) if f.endswith('.png')]
-            png_files.sort()  # Sort to ensure correct page order
-            
-            # Add each image to the ZIP file
-            for png_file in png_files:
-                png_path = os.path.join(temp_dir, png_file)
-                zipf.write(png_path, png_file)
-        
-        print(f"Successfully converted {input_file} to CBZ format with {len(png_files)} pages")
+        os.replace(partial_file, output_file)
+        log.info(f"Successfully converted {input_file} to CBZ format with {successful_pages} pages")
         return True
         
     except Exception as e:
-        print(f"Error converting {input_file}: {str(e)}")
+        log.error(f"Error converting {input_file}: {str(e)}")
         return False
     finally:
         # Clean up the temporary directory
-        print(f"Cleaning up temporary directory: {temp_dir}")
+        log.debug(f"Cleaning up temporary directory: {temp_dir}")
         shutil.rmtree(temp_dir)
+        if os.path.exists(partial_file):
+            os.remove(partial_file)
+
+def find_djvu_files(folder):
+    """Recursively yield directory entries of all DJVU files in a folder, skipping unreadable folders."""
+    try:
+        entries = os.scandir(folder)
+    except OSError as e:
+        log.warning(f"Skipping folder that cannot be read: {folder} ({str(e)})")
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from find_djvu_files(entry.path)
+            elif entry.is_file() and entry.name.lower().endswith(('.djvu', '.djv')):
+                yield entry
 
-def process_folder(input_folder, output_folder=None, quality=85, max_workers=4):
+def process_folder(input_folder, output_folder=None, quality=85, max_workers=None, force=False, verbose=False):
     """
     Process all DJVU files in a folder and convert them to CBZ.
     
@@ -150,8 +412,19 @@ def process_folder(input_folder, output_folder=None, quality=85, max_workers=4):
         input_folder: Folder containing DJVU files
         output_folder: Folder to save CBZ files (defaults to input_folder if None)
         quality: Image quality (1-100)
-        max_workers: Maximum number of parallel conversions
+        max_workers: Maximum number of parallel conversions (defaults to the CPU count)
+        force: Convert files even if their CBZ file already exists
+        verbose: Show the error output of failed ddjvu runs
     """
+    set_verbose(verbose)
+    
+    # Page encoding is CPU-bound, so by default use one worker per core
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, max_workers)
+    # Share the remaining cores between the page ranges of each file
+    inner_workers = max(1, (os.cpu_count() or 1) // max_workers)
+    
     print(f"Starting process with the following parameters:")
     print(f"Input folder: {input_folder}")
     print(f"Output folder: {output_folder}")
@@ -175,23 +448,34 @@ def process_folder(input_folder, output_folder=None, quality=85, max_workers=4):
     djvu_files = []
     print(f"Searching for DJVU files in: {input_folder}")
     
-    for root, _, files in os.walk(input_folder):
-        for file in files:
-            if file.lower().endswith(('.djvu', '.djv')):
-                print(f"Found DJVU file: {file}")
-                input_path = os.path.join(root, file)
-                # Create relative path for output
-                rel_path = os.path.relpath(root, input_folder)
-                output_subdir = os.path.join(output_folder, rel_path)
-                
-                if not os.path.exists(output_subdir):
-                    os.makedirs(output_subdir)
-                
-                output_path = os.path.join(output_subdir, os.path.splitext(file)[0] + '.cbz')
-                djvu_files.append((input_path, output_path))
+    output_dirs = set()
+    skipped = 0
+    for entry in find_djvu_files(input_folder):
+        log.debug(f"Found DJVU file: {entry.name}")
+        # Create relative path for output
+        rel_path = os.path.relpath(os.path.dirname(entry.path), input_folder)
+        output_subdir = os.path.join(output_folder, rel_path)
+        output_path = os.path.join(output_subdir, os.path.splitext(entry.name)[0] + '.cbz')
+        
+        # Skip files converted by a previous run
+        if not force and os.path.exists(output_path) and os.path.getsize(output_path) > 0:
+            log.debug(f"Skipping already converted file: {entry.name}")
+            skipped += 1
+            continue
+        
+        output_dirs.add(output_subdir)
+        djvu_files.append((entry.path, output_path))
+    
+    # Create each output subfolder once
+    for output_dir in output_dirs:
+        os.makedirs(output_dir, exist_ok=True)
+    
+    if skipped:
+        print(f"Skipped {skipped} DJVU files that are already converted (use --force to convert them again).")
     
     if not djvu_files:
-        print("No DJVU files found in the input folder.")
+        if not skipped:
+            print("No DJVU files found in the input folder.")
         return
     
     print(f"Found {len(djvu_files)} DJVU files to convert.")
@@ -202,31 +486,32 @@ def process_folder(input_folder, output_folder=None, quality=85, max_workers=4):
         return
     
     # Install required Python packages if needed
-    try:
-        from PIL import Image
-    except ImportError:
-        print("Installing required Python package: Pillow")
-        subprocess.run(["pip", "install", "Pillow"], check=True)
+    ensure_pillow()
     
     # Convert files in parallel or sequentially
     if max_workers > 1:
         print(f"Starting parallel conversion with {max_workers} workers")
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Create a list of futures
-            futures = [executor.submit(convert_djvu_to_cbz, input_file, output_file, quality) 
-                      for input_file, output_file in djvu_files]
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=init_worker,
+                                 initargs=(verbose, log.getEffectiveLevel())) as executor:
+            # Map each future to its input file
+            futures = {executor.submit(convert_djvu_to_cbz, input_file, output_file, quality, inner_workers): input_file
+                       for input_file, output_file in djvu_files}
             
-            # Process with progress bar
+            # Process with progress bar, in the order the conversions finish
             successful = 0
-            for future in tqdm(futures, total=len(futures), desc="Converting"):
-                if future.result():
-                    successful += 1
+            for future in tqdm(as_completed(futures), total=len(futures), desc="Converting"):
+                try:
+                    if future.result():
+                        successful += 1
+                except Exception as e:
+                    # The worker process died (e.g. out of memory), count the file as failed
+                    log.error(f"Error converting {futures[future]}: {str(e)}")
     else:
         # Sequential processing
         print("Starting sequential conversion")
         successful = 0
         for input_file, output_file in tqdm(djvu_files, desc="Converting"):
-            if convert_djvu_to_cbz(input_file, output_file, quality):
+            if convert_djvu_to_cbz(input_file, output_file, quality, inner_workers):
                 successful += 1
     
     print(f"Conversion completed. Successfully converted {successful} out of {len(djvu_files)} files.")
@@ -239,14 +524,23 @@ if __name__ == "__main__":
                         help="Image quality (1-100, higher is better quality but larger file size)")
     parser.add_argument("-w", "--workers", type=int, default=1, 
                         help="Maximum number of parallel conversions (default: 1)")
+    parser.add_argument("-f", "--force", action="store_true",
+                        help="Convert files even if their CBZ file already exists")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="Show detailed progress and error output of failed ddjvu runs")
     
     args = parser.parse_args()
     
+    # Per-page messages are only shown in verbose mode, tqdm shows the progress
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO, format=LOG_FORMAT)
+    
     # Print arguments for debugging
     print(f"Arguments received:")
     print(f"input_folder: {args.input_folder}")
     print(f"output_folder: {args.output_folder}")
     print(f"quality: {args.quality}")
     print(f"workers: {args.workers}")
+    print(f"force: {args.force}")
+    print(f"verbose: {args.verbose}")
     
-    process_folder(args.input_folder, args.output_folder, args.quality, args.workers)
+    process_folder(args.input_folder, args.output_folder, args.quality, args.workers, args.force, args.verbose)